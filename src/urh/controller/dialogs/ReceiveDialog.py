@@ -101,7 +101,7 @@ class ReceiveDialog(SendRecvDialog):
 
     @pyqtSlot()
     def on_save_clicked(self):
-        data = self.device.data[: self.device.current_index]
+        data = self.device.data_view()
 
         dev = self.device
         big_val = Formatter.big_value_with_suffix
@@ -1,5 +1,7 @@
 import time
 from enum import Enum
+from functools import partial
+from operator import attrgetter
 
 import numpy as np
 from PyQt5.QtCore import pyqtSignal, QObject
@@ -10,6 +12,7 @@ from urh.dev.native.Device import Device
 from urh.plugins.NetworkSDRInterface.NetworkSDRInterfacePlugin import (
     NetworkSDRInterfacePlugin,
 )
+from urh.signalprocessing.IQArray import IQArray
 from urh.util.Logger import logger
 
 
@@ -19,6 +22,143 @@ class Mode(Enum):
     spectrum = 3
 
 
+# Native device backends are imported on first use. The imports are spelled out statically,
+# so that PyInstaller finds the backend modules for the release builds.
+
+
+def _import_hackrf():
+    from urh.dev.native.HackRF import HackRF
+
+    return HackRF
+
+
+def _import_rad1o():
+    from urh.dev.native.Rad1o import Rad1o
+
+    return Rad1o
+
+
+def _import_rtlsdr():
+    from urh.dev.native.RTLSDR import RTLSDR
+
+    return RTLSDR
+
+
+def _import_rtltcp():
+    from urh.dev.native.RTLSDRTCP import RTLSDRTCP
+
+    return RTLSDRTCP
+
+
+def _import_limesdr():
+    from urh.dev.native.LimeSDR import LimeSDR
+
+    return LimeSDR
+
+
+def _import_bladerf():
+    from urh.dev.native.BladeRF import BladeRF
+
+    return BladeRF
+
+
+def _import_plutosdr():
+    from urh.dev.native.PlutoSDR import PlutoSDR
+
+    return PlutoSDR
+
+
+def _import_airspy():
+    from urh.dev.native.AirSpy import AirSpy
+
+    return AirSpy
+
+
+def _import_usrp():
+    from urh.dev.native.USRP import USRP
+
+    return USRP
+
+
+def _import_sdrplay():
+    from urh.dev.native.SDRPlay import SDRPlay
+
+    return SDRPlay
+
+
+def _import_soundcard():
+    from urh.dev.native.SoundCard import SoundCard
+
+    return SoundCard
+
+
+# Import function and constructor parameters of native device backends by normalized device name
+NATIVE_DEVICES = {
+    "hackrf": (
+        _import_hackrf,
+        ("center_freq", "sample_rate", "bandwidth", "gain", "if_gain", "baseband_gain"),
+    ),
+    "rad1o": (
+        _import_rad1o,
+        ("center_freq", "sample_rate", "bandwidth", "gain", "if_gain", "baseband_gain"),
+    ),
+    "rtlsdr": (_import_rtlsdr, ("freq", "gain", "srate", "device_number")),
+    "rtltcp": (_import_rtltcp, ("freq", "gain", "srate", "bandwidth", "device_number")),
+    "limesdr": (_import_limesdr, ("center_freq", "sample_rate", "bandwidth", "gain")),
+    "bladerf": (_import_bladerf, ("center_freq", "sample_rate", "bandwidth", "gain")),
+    "plutosdr": (_import_plutosdr, ("center_freq", "sample_rate", "bandwidth", "gain")),
+    "airspy": (
+        _import_airspy,
+        ("center_freq", "sample_rate", "bandwidth", "gain", "if_gain", "baseband_gain"),
+    ),
+    "usrp": (_import_usrp, ("center_freq", "sample_rate", "bandwidth", "gain")),
+    "sdrplay": (
+        _import_sdrplay,
+        ("center_freq", "sample_rate", "bandwidth", "gain", "if_gain"),
+    ),
+    "soundcard": (_import_soundcard, ("sample_rate",)),
+}
+
+_native_device_cache = dict()
+
+
+def _native_device_key(name: str) -> str:
+    """
+    Normalize a lowercase device name to its key in NATIVE_DEVICES,
+    e.g. "rtl-sdr" -> "rtlsdr", "airspy mini" -> "airspy"
+
+    :return:
+    """
+    key = name.replace("-", "").split(" ")[0]
+    if key not in NATIVE_DEVICES:
+        raise NotImplementedError(
+            "Native Backend for {0} not yet implemented".format(name)
+        )
+    return key
+
+
+def _get_native_device(name: str):
+    """
+    Get class and constructor parameter names of the native backend for a lowercase device name.
+    Backend modules are imported on first use and the result is cached per device name.
+
+    :return: None if name is no native device
+    """
+    try:
+        return _native_device_cache[name]
+    except KeyError:
+        pass
+
+    if name in map(str.lower, BackendHandler.DEVICE_NAMES):
+        import_device_class, parameter_names = NATIVE_DEVICES[_native_device_key(name)]
+        result = import_device_class(), parameter_names
+    else:
+        result = None
+
+    _native_device_cache[name] = result
+    return result
+
+
 class VirtualDevice(QObject):
     """
     Wrapper class for providing sending methods for grc and native devices
@@ -61,6 +201,7 @@ class VirtualDevice(QObject):
         self.mode = mode
         self.backend_handler = backend_handler
         self.__data_timestamp = 0
+        self.__spectrum_frequencies = dict()  # cache for frequency axis of spectrum
 
         freq = config.DEFAULT_FREQUENCY if freq is None else freq
         sample_rate = config.DEFAULT_SAMPLE_RATE if sample_rate is None else sample_rate
@@ -86,6 +227,7 @@ class VirtualDevice(QObject):
                 logger.warning("Invalid device name: {0}".format(name))
                 self.backend = Backends.none
                 self.__dev = None
+                self.__init_backend_accessors()
                 return
 
         if self.backend == Backends.grc:
@@ -138,127 +280,24 @@ class VirtualDevice(QObject):
             self.__dev.sender_needs_restart.connect(self.emit_sender_needs_restart)
         elif self.backend == Backends.native:
             name = self.name.lower()
-            if name in map(str.lower, BackendHandler.DEVICE_NAMES):
-                if name == "hackrf":
-                    from urh.dev.native.HackRF import HackRF
-
-                    self.__dev = HackRF(
-                        center_freq=freq,
-                        sample_rate=sample_rate,
-                        bandwidth=bandwidth,
-                        gain=gain,
-                        if_gain=if_gain,
-                        baseband_gain=baseband_gain,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name == "rad1o":
-                    from urh.dev.native.Rad1o import Rad1o
-
-                    self.__dev = Rad1o(
-                        center_freq=freq,
-                        sample_rate=sample_rate,
-                        bandwidth=bandwidth,
-                        gain=gain,
-                        if_gain=if_gain,
-                        baseband_gain=baseband_gain,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name.replace("-", "") == "rtlsdr":
-                    from urh.dev.native.RTLSDR import RTLSDR
-
-                    self.__dev = RTLSDR(
-                        freq=freq,
-                        gain=gain,
-                        srate=sample_rate,
-                        device_number=0,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name.replace("-", "") == "rtltcp":
-                    from urh.dev.native.RTLSDRTCP import RTLSDRTCP
-
-                    self.__dev = RTLSDRTCP(
-                        freq=freq,
-                        gain=gain,
-                        srate=sample_rate,
-                        bandwidth=bandwidth,
-                        device_number=0,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name == "limesdr":
-                    from urh.dev.native.LimeSDR import LimeSDR
-
-                    self.__dev = LimeSDR(
-                        center_freq=freq,
-                        sample_rate=sample_rate,
-                        bandwidth=bandwidth,
-                        gain=gain,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name == "bladerf":
-                    from urh.dev.native.BladeRF import BladeRF
-
-                    self.__dev = BladeRF(
-                        center_freq=freq,
-                        sample_rate=sample_rate,
-                        bandwidth=bandwidth,
-                        gain=gain,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name == "plutosdr":
-                    from urh.dev.native.PlutoSDR import PlutoSDR
-
-                    self.__dev = PlutoSDR(
-                        center_freq=freq,
-                        sample_rate=sample_rate,
-                        bandwidth=bandwidth,
-                        gain=gain,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name.startswith("airspy"):
-                    from urh.dev.native.AirSpy import AirSpy
-
-                    self.__dev = AirSpy(
-                        center_freq=freq,
-                        sample_rate=sample_rate,
-                        bandwidth=bandwidth,
-                        gain=gain,
-                        if_gain=if_gain,
-                        baseband_gain=baseband_gain,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name.startswith("usrp"):
-                    from urh.dev.native.USRP import USRP
-
-                    self.__dev = USRP(
-                        center_freq=freq,
-                        sample_rate=sample_rate,
-                        bandwidth=bandwidth,
-                        gain=gain,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name.startswith("sdrplay"):
-                    from urh.dev.native.SDRPlay import SDRPlay
-
-                    self.__dev = SDRPlay(
-                        center_freq=freq,
-                        sample_rate=sample_rate,
-                        bandwidth=bandwidth,
-                        gain=gain,
-                        if_gain=if_gain,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                elif name == "soundcard":
-                    from urh.dev.native.SoundCard import SoundCard
-
-                    self.__dev = SoundCard(
-                        sample_rate=sample_rate,
-                        resume_on_full_receive_buffer=resume_on_full_receive_buffer,
-                    )
-                else:
-                    raise NotImplementedError(
-                        "Native Backend for {0} not yet implemented".format(name)
-                    )
-
+            native_device = _get_native_device(name)
+            if native_device is not None:
+                device_class, parameter_names = native_device
+                parameters = {
+                    "center_freq": freq,
+                    "freq": freq,
+                    "sample_rate": sample_rate,
+                    "srate": sample_rate,
+                    "bandwidth": bandwidth,
+                    "gain": gain,
+                    "if_gain": if_gain,
+                    "baseband_gain": baseband_gain,
+                    "device_number": 0,
+                }
+                self.__dev = device_class(
+                    resume_on_full_receive_buffer=resume_on_full_receive_buffer,
+                    **{p: parameters[p] for p in parameter_names}
+                )
             elif name == "test":
                 # For Unittests Only
                 self.__dev = Device(
@@ -295,6 +334,112 @@ class VirtualDevice(QObject):
         if mode == Mode.spectrum:
             self.__dev.is_in_spectrum_mode = True
 
+        self.__init_backend_accessors()
+
+    def __init_backend_accessors(self):
+        """
+        Bind getters and setters of frequently used properties once for the backend and mode of this device,
+        so these properties need not check the backend on every access
+
+        :return:
+        """
+        dev = self.__dev
+        is_send = self.mode == Mode.send
+
+        def getter(name: str):
+            # Bind property functions directly to skip the descriptor lookup on the device
+            prop = getattr(type(dev), name, None)
+            if isinstance(prop, property) and prop.fget is not None:
+                return prop.fget.__get__(dev)
+            return partial(attrgetter(name), dev)
+
+        def setter(name: str):
+            prop = getattr(type(dev), name, None)
+            if isinstance(prop, property) and prop.fset is not None:
+                return prop.fset.__get__(dev)
+            return partial(setattr, dev, name)
+
+        def unsupported(*args):
+            raise ValueError("Unsupported Backend")
+
+        def ignore(value):
+            pass
+
+        def accessors(name: str):
+            return (getter(name), setter(name)) if name else (unsupported, unsupported)
+
+        def network_data():
+            return dev.receive_buffer if dev.raw_mode else dev.received_bits
+
+        def network_send_data():
+            raise NotImplementedError("Todo")
+
+        # Functions bound here must not reference self, as they are stored on self
+        no_data_msg = "{}:{} has no data".format(
+            self.__class__.__name__, self.backend.name
+        )
+
+        def no_data(value):
+            logger.warning(no_data_msg)
+
+        def init_native_send_parameters(value):
+            dev.init_send_parameters(value, dev.sending_repeats)
+
+        self.__get_bandwidth = getter("bandwidth")
+        self.__get_gain = getter("gain")
+        self.__get_baseband_gain = getter("baseband_gain")
+        self.__get_sample_rate = getter("sample_rate")
+
+        self.__get_current_index, self.__set_current_index = accessors(
+            {
+                Backends.grc: "current_index",
+                Backends.native: (
+                    "current_sent_sample" if is_send else "current_recv_index"
+                ),
+                Backends.network: (
+                    "current_sent_sample" if is_send else "current_receive_index"
+                ),
+            }.get(self.backend)
+        )
+
+        self.__get_current_iteration, self.__set_current_iteration = accessors(
+            {
+                Backends.grc: "current_iteration",
+                Backends.native: "current_sending_repeat",
+                Backends.network: "current_sending_repeat",
+            }.get(self.backend)
+        )
+
+        self.__get_data, self.__set_data = {
+            Backends.grc: accessors("data"),
+            Backends.native: accessors(
+                "samples_to_send" if is_send else "receive_buffer"
+            ),
+            Backends.network: (
+                network_send_data if is_send else network_data,
+                no_data,
+            ),
+        }.get(self.backend, (unsupported, no_data))
+
+        self.__get_samples_to_send, self.__set_samples_to_send = {
+            Backends.grc: accessors("data"),
+            Backends.native: (getter("samples_to_send"), init_native_send_parameters),
+            Backends.network: accessors("samples_to_send"),
+        }.get(self.backend, (unsupported, unsupported))
+
+        self.__get_ip, self.__set_ip = {
+            Backends.grc: accessors("device_ip"),
+            Backends.native: accessors("device_ip"),
+            Backends.network: (unsupported, ignore),
+            Backends.none: (unsupported, ignore),
+        }.get(self.backend, (unsupported, unsupported))
+
+        self.__get_frequency, self.__set_frequency = {
+            Backends.grc: accessors("frequency"),
+            Backends.native: accessors("frequency"),
+            Backends.network: (unsupported, ignore),
+        }.get(self.backend, (unsupported, unsupported))
+
     @property
     def backend_is_native(self) -> bool:
         return self.backend == Backends.native
@@ -339,7 +484,7 @@ class VirtualDevice(QObject):
 
     @property
     def bandwidth(self):
-        return self.__dev.bandwidth
+        return self.__get_bandwidth()
 
     @bandwidth.setter
     def bandwidth(self, value):
@@ -382,19 +527,11 @@ class VirtualDevice(QObject):
 
     @property
     def frequency(self):
-        if self.backend in (Backends.grc, Backends.native):
-            return self.__dev.frequency
-        else:
-            raise ValueError("Unsupported Backend")
+        return self.__get_frequency()
 
     @frequency.setter
     def frequency(self, value):
-        if self.backend in (Backends.grc, Backends.native):
-            self.__dev.frequency = value
-        elif self.backend == Backends.network:
-            pass
-        else:
-            raise ValueError("Unsupported Backend")
+        self.__set_frequency(value)
 
     @property
     def num_samples_to_send(self) -> int:
@@ -461,7 +598,7 @@ class VirtualDevice(QObject):
 
     @property
     def gain(self):
-        return self.__dev.gain
+        return self.__get_gain()
 
     @gain.setter
     def gain(self, value):
@@ -486,7 +623,7 @@ class VirtualDevice(QObject):
 
     @property
     def baseband_gain(self):
-        return self.__dev.baseband_gain
+        return self.__get_baseband_gain()
 
     @baseband_gain.setter
     def baseband_gain(self, value):
@@ -495,13 +632,14 @@ class VirtualDevice(QObject):
     @property
     def sample_rate(self):
         try:
-            return self.__dev.sample_rate
+            return self.__get_sample_rate()
         except:
             return 1e6
 
     @sample_rate.setter
     def sample_rate(self, value):
         self.__dev.sample_rate = value
+        self.__spectrum_frequencies.clear()
 
     @property
     def channel_index(self) -> int:
@@ -537,23 +675,11 @@ class VirtualDevice(QObject):
 
     @property
     def samples_to_send(self):
-        if self.backend == Backends.grc:
-            return self.__dev.data
-        elif self.backend in (Backends.native, Backends.network):
-            return self.__dev.samples_to_send
-        else:
-            raise ValueError("Unsupported Backend")
+        return self.__get_samples_to_send()
 
     @samples_to_send.setter
     def samples_to_send(self, value):
-        if self.backend == Backends.grc:
-            self.__dev.data = value
-        elif self.backend == Backends.native:
-            self.__dev.init_send_parameters(value, self.num_sending_repeats)
-        elif self.backend == Backends.network:
-            self.__dev.samples_to_send = value
-        else:
-            raise ValueError("Unsupported Backend")
+        self.__set_samples_to_send(value)
 
     @property
     def subdevice(self):
@@ -569,23 +695,11 @@ class VirtualDevice(QObject):
 
     @property
     def ip(self):
-        if self.backend == Backends.grc:
-            return self.__dev.device_ip
-        elif self.backend == Backends.native:
-            return self.__dev.device_ip
-        else:
-            raise ValueError("Unsupported Backend")
+        return self.__get_ip()
 
     @ip.setter
     def ip(self, value):
-        if self.backend == Backends.grc:
-            self.__dev.device_ip = value
-        elif self.backend == Backends.native:
-            self.__dev.device_ip = value
-        elif self.backend in (Backends.none, Backends.network):
-            pass
-        else:
-            raise ValueError("Unsupported Backend")
+        self.__set_ip(value)
 
     @property
     def port(self):
@@ -603,37 +717,31 @@ class VirtualDevice(QObject):
 
     @property
     def data(self):
-        if self.backend == Backends.grc:
-            return self.__dev.data
-        elif self.backend == Backends.native:
-            if self.mode == Mode.send:
-                return self.__dev.samples_to_send
-            else:
-                return self.__dev.receive_buffer
-        elif self.backend == Backends.network:
-            if self.mode == Mode.send:
-                raise NotImplementedError("Todo")
-            else:
-                if self.__dev.raw_mode:
-                    return self.__dev.receive_buffer
-                else:
-                    return self.__dev.received_bits
-        else:
-            raise ValueError("Unsupported Backend")
+        return self.__get_data()
 
     @data.setter
     def data(self, value):
-        if self.backend == Backends.grc:
-            self.__dev.data = value
-        elif self.backend == Backends.native:
-            if self.mode == Mode.send:
-                self.__dev.samples_to_send = value
-            else:
-                self.__dev.receive_buffer = value
-        else:
-            logger.warning(
-                "{}:{} has no data".format(self.__class__.__name__, self.backend.name)
-            )
+        self.__set_data(value)
+
+    def data_view(self, offset=0, length=None) -> np.ndarray:
+        """
+        Get a view on the received raw samples without copying them.
+        The view starts at offset and covers length samples or, if length is None,
+        reaches up to the current receive index.
+
+        :return: empty array if device has not received anything yet
+        """
+        if self.mode == Mode.send or not self.is_raw_mode:
+            raise ValueError("Data view only available for received raw samples")
+
+        data = self.data
+        if data is None:
+            return np.empty((0, 2), dtype=self.data_type)
+        if isinstance(data, IQArray):
+            data = data.data
+
+        stop = self.current_index if length is None else offset + length
+        return data[offset:stop]
 
     @property
     def data_timestamp(self):
@@ -688,55 +796,19 @@ class VirtualDevice(QObject):
 
     @property
     def current_index(self):
-        if self.backend == Backends.grc:
-            return self.__dev.current_index
-        elif self.backend == Backends.native:
-            if self.mode == Mode.send:
-                return self.__dev.current_sent_sample
-            else:
-                return self.__dev.current_recv_index
-        elif self.backend == Backends.network:
-            if self.mode == Mode.send:
-                return self.__dev.current_sent_sample
-            else:
-                return self.__dev.current_receive_index
-        else:
-            raise ValueError("Unsupported Backend")
+        return self.__get_current_index()
 
     @current_index.setter
     def current_index(self, value):
-        if self.backend == Backends.grc:
-            self.__dev.current_index = value
-        elif self.backend == Backends.native:
-            if self.mode == Mode.send:
-                self.__dev.current_sent_sample = value
-            else:
-                self.__dev.current_recv_index = value
-        elif self.backend == Backends.network:
-            if self.mode == Mode.send:
-                self.__dev.current_sent_sample = value
-            else:
-                self.__dev.current_receive_index = value
-        else:
-            raise ValueError("Unsupported Backend")
+        self.__set_current_index(value)
 
     @property
     def current_iteration(self):
-        if self.backend == Backends.grc:
-            return self.__dev.current_iteration
-        elif self.backend in (Backends.native, Backends.network):
-            return self.__dev.current_sending_repeat
-        else:
-            raise ValueError("Unsupported Backend")
+        return self.__get_current_iteration()
 
     @current_iteration.setter
     def current_iteration(self, value):
-        if self.backend == Backends.grc:
-            self.__dev.current_iteration = value
-        elif self.backend in (Backends.native, Backends.network):
-            self.__dev.current_sending_repeat = value
-        else:
-            raise ValueError("Unsupported Backend")
+        self.__set_current_iteration(value)
 
     @property
     def sending_finished(self):
@@ -753,19 +825,35 @@ class VirtualDevice(QObject):
             if self.backend == Backends.grc:
                 return self.__dev.x, self.__dev.y
             elif self.backend == Backends.native or self.backend == Backends.network:
-                w = np.abs(np.fft.fft(self.__dev.receive_buffer.as_complex64()))
-                freqs = np.fft.fftfreq(len(w), 1 / self.sample_rate)
-                idx = np.argsort(freqs)
-                return freqs[idx].astype(np.float32), w[idx].astype(np.float32)
+                # fft does not modify its input, so no copy of receive buffer is needed
+                samples = self.__dev.receive_buffer.as_complex64(copy=False)
+                w = np.fft.fft(samples)
+                # NumPy < 2 computes the FFT in complex128 even for complex64 input, so this cast is an extra pass there.
+                # It makes abs return the float32 magnitudes the plot needs. For NumPy >= 2 the cast is a no-op.
+                w = np.abs(w.astype(np.complex64, copy=False))
+                # fftshift is equivalent to sorting by frequency but needs no O(n log n) argsort
+                return self.__get_spectrum_frequencies(len(w)), np.fft.fftshift(w)
         else:
             raise ValueError("Spectrum x only available in spectrum mode")
 
+    def __get_spectrum_frequencies(self, n: int) -> np.ndarray:
+        key = (n, self.sample_rate)
+        try:
+            return self.__spectrum_frequencies[key]
+        except KeyError:
+            freqs = np.fft.fftfreq(n, 1 / self.sample_rate).astype(np.float32)
+            freqs = np.fft.fftshift(freqs)
+            freqs.setflags(write=False)
+            self.__spectrum_frequencies[key] = freqs
+            return freqs
+
     def start(self):
         self.__data_timestamp = time.time()
         if self.backend == Backends.grc:
             self.__dev.setTerminationEnabled(True)
             self.__dev.terminate()
-            time.sleep(0.1)
+            # Returns as soon as the thread finished instead of always sleeping 100ms
+            self.__dev.wait(100)
             self.__dev.start()  # Already connected to started signal in constructor
         elif self.backend == Backends.native:
             if self.mode == Mode.send:
@@ -806,7 +894,7 @@ class VirtualDevice(QObject):
         if self.backend == Backends.grc:
             self.__dev.stop(msg)  # Already connected to stopped in constructor
         elif self.backend == Backends.native:
-            self.read_messages()  # Clear errors
+            self.clear_messages()
             self.__dev.stop_rx_mode("Stop on error")
             self.__dev.stop_tx_mode("Stop on error")
             self.emit_stopped_signal()
@@ -817,7 +905,7 @@ class VirtualDevice(QObject):
         if self.backend == Backends.grc:
             if self.mode == Mode.send:
                 self.__dev.socket.close()
-                time.sleep(0.1)
+                self.__dev.wait(100)
             self.__dev.quit()
             self.data = None
 
@@ -872,6 +960,31 @@ class VirtualDevice(QObject):
         else:
             raise ValueError("Unsupported Backend")
 
+    def clear_messages(self):
+        """
+        Drop pending messages of native device. Like read_messages, ready_for_action and fatal_error_occurred
+        are still emitted for start markers, but the messages are only joined if device failed to start.
+
+        :return:
+        """
+        if self.backend != Backends.native:
+            return
+
+        messages = list(self.__dev.device_messages)
+        self.__dev.device_messages.clear()
+
+        if any("successfully started" in msg for msg in messages):
+            self.ready_for_action.emit()
+            return
+
+        for i, msg in enumerate(messages):
+            if "failed to start" in msg:
+                error = "\n".join(messages[i:])
+                if not error.endswith("\n"):
+                    error += "\n"
+                self.fatal_error_occurred.emit(error[error.index("failed to start") :])
+                return
+
     def set_server_port(self, port: int):
         if self.backend == Backends.network:
             self.__dev.server_port = port
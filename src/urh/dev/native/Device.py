@@ -719,6 +719,7 @@ class Device(object):
         self.is_transmitting = True
         self.parent_ctrl_conn, self.child_ctrl_conn = Pipe()
         self.init_send_parameters(samples_to_send, repeats, resume=resume)
+        self.init_send_buffer()
 
         logger.info("{0}: Starting TX Mode".format(self.__class__.__name__))
 
@@ -850,15 +851,18 @@ class Device(object):
                 samples_to_send = IQArray(samples_to_send).convert_to(self.DATA_TYPE)
 
             self.samples_to_send = samples_to_send
+            # Send buffer is built lazily on next TX start, so consecutive updates of samples
+            # (e.g. while user edits the signal) do not convert the whole signal to bytes each time
             self.send_buffer = None
+        elif not resume:
+            self.current_sending_repeat = 0
+
+        if repeats is not None:
+            self.sending_repeats = repeats
 
+    def init_send_buffer(self):
         if self.send_buffer is None:
             if isinstance(self.samples_to_send, IQArray):
                 self.send_buffer = self.iq_to_bytes(self.samples_to_send.data)
             else:
                 self.send_buffer = self.iq_to_bytes(self.samples_to_send)
-        elif not resume:
-            self.current_sending_repeat = 0
-
-        if repeats is not None:
-            self.sending_repeats = repeats
@@ -89,8 +89,18 @@ class IQArray(object):
     def dtype(self):
         return self.__data.dtype
 
-    def as_complex64(self):
-        return self.convert_to(np.float32).flatten(order="C").view(np.complex64)
+    def as_complex64(self, copy=True):
+        """
+        Get samples as complex64 array. Only float32 data needs to be copied for this,
+        other types are converted into a new array anyway.
+        With copy=False float32 data is returned as view on this array.
+
+        :return:
+        """
+        data = self.convert_to(np.float32)
+        if copy and data is self.__data:
+            return data.flatten(order="C").view(np.complex64)
+        return data.reshape(-1).view(np.complex64)
 
     def to_bytes(self):
         return self.__data.tostring()
@@ -169,18 +169,16 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
         while self.is_running:
             time.sleep(0.01)
             if self.rcv_device.is_raw_mode:
-                if old_index <= self.rcv_device.current_index:
-                    data = self.rcv_device.data[
-                        old_index : self.rcv_device.current_index
-                    ]
-                else:
-                    data = np.concatenate(
-                        (
-                            self.rcv_device.data[old_index:],
-                            self.rcv_device.data[: self.rcv_device.current_index],
-                        )
+                current_index = self.rcv_device.current_index
+                if old_index <= current_index:
+                    data = self.rcv_device.data_view(
+                        old_index, current_index - old_index
                     )
-                old_index = self.rcv_device.current_index
+                else:
+                    # Buffer wrapped around, so both parts need to be copied anyway
+                    data = self.rcv_device.data
+                    data = np.concatenate((data[old_index:], data[:current_index]))
+                old_index = current_index
                 self.__demodulate_data(data)
             elif self.rcv_device.backend == Backends.network:
                 # We receive the bits here
@@ -1,5 +1,5 @@
 import numpy as np
-from multiprocessing import Value, Array
+from multiprocessing import Value, Array, Lock
 
 from urh.signalprocessing.IQArray import IQArray
 
@@ -7,6 +7,14 @@ from urh.signalprocessing.IQArray import IQArray
 class RingBuffer(object):
     """
     A RingBuffer containing complex values.
+
+    The buffer is meant for exactly one producer (push) and one consumer (pop), which may live in different processes.
+    Positions are only loaded and stored under a lock, whose acquire and release order the memory accesses:
+    values written before a position is stored are visible to the side which loads this position afterwards.
+    So the producer stores the write position only after the values are in place,
+    the consumer stores the read position only after it copied the values out and
+    clear only records a request, which the consumer carries out on its next pop.
+    The values themselves are copied outside of the lock, so producer and consumer do not wait for each other's copy.
     """
 
     def __init__(self, size: int, dtype=np.float32):
@@ -20,31 +28,55 @@ class RingBuffer(object):
             np.float32: "f",
             np.float64: "d",
         }
-        self.__data = Array(types[self.dtype], 2 * size)
+        self.__data = Array(types[self.dtype], 2 * size, lock=False)
 
         self.size = size
-        self.__left_index = Value("L", 0)
-        self.__right_index = Value("L", 0)
-        self.__length = Value("L", 0)
+
+        # Positions run modulo a multiple of size, so a full buffer can be told apart from an empty one
+        self.__position_range = 4 * size
+        self.__position_lock = Lock()
+        self.__read_position = Value("L", 0, lock=False)
+        self.__write_position = Value("L", 0, lock=False)
+        self.__clear_position = Value("L", 0, lock=False)
+        self.__clear_requests = Value("L", 0, lock=False)
+        self.__handled_clear_requests = Value("L", 0, lock=False)
 
     def __len__(self):
-        return self.__length.value
+        first, end, _ = self.__positions()
+        return self.__distance(end, first)
+
+    def __distance(self, position: int, start: int) -> int:
+        return (position - start) % self.__position_range
+
+    def __positions(self):
+        """
+        Get positions of first value and behind last value. A clear request, which the consumer did not carry out yet,
+        is already taken into account.
+
+        :return: first position, end position and number of clear requests they are consistent with
+        """
+        with self.__position_lock:
+            first = self.__read_position.value
+            end = self.__write_position.value
+            clear_position = self.__clear_position.value
+            clear_requests = self.__clear_requests.value
+            handled_clear_requests = self.__handled_clear_requests.value
+
+        # Ignore the clear position if consumer has already popped beyond it
+        if clear_requests != handled_clear_requests and self.__distance(
+            clear_position, first
+        ) <= self.__distance(end, first):
+            first = clear_position
+
+        return first, end, clear_requests
 
     @property
     def left_index(self):
-        return self.__left_index.value
-
-    @left_index.setter
-    def left_index(self, value):
-        self.__left_index.value = value % self.size
+        return self.__positions()[0] % self.size
 
     @property
     def right_index(self):
-        return self.__right_index.value
-
-    @right_index.setter
-    def right_index(self, value):
-        self.__right_index.value = value % self.size
+        return self.__write_position.value % self.size
 
     @property
     def is_empty(self) -> bool:
@@ -56,7 +88,7 @@ class RingBuffer(object):
 
     @property
     def data(self):
-        return np.frombuffer(self.__data.get_obj(), dtype=self.dtype).reshape(
+        return np.frombuffer(self.__data, dtype=self.dtype).reshape(
             len(self.__data) // 2, 2
         )
 
@@ -74,8 +106,16 @@ class RingBuffer(object):
         return np.concatenate((data[left:right], data[right:], data[:left]))
 
     def clear(self):
-        self.left_index = 0
-        self.right_index = 0
+        """
+        Drop all values that are in buffer now. This may be called while producer and consumer are running,
+        but only from one side at a time. The values are dropped by the consumer on its next pop,
+        however, len and is_empty already respect the clear.
+        """
+        with self.__position_lock:
+            self.__clear_position.value = self.__write_position.value
+            self.__clear_requests.value = (
+                self.__clear_requests.value + 1
+            ) % self.__position_range
 
     def will_fit(self, number_values: int) -> bool:
         return number_values <= self.space_left
@@ -88,17 +128,18 @@ class RingBuffer(object):
         if len(self) + n > self.size:
             raise ValueError("Too much data to push to RingBuffer")
 
-        slide_1 = np.s_[self.right_index : min(self.right_index + n, self.size)]
-        slide_2 = np.s_[: max(self.right_index + n - self.size, 0)]
-        with self.__data.get_lock():
-            data = np.frombuffer(self.__data.get_obj(), dtype=self.dtype).reshape(
-                len(self.__data) // 2, 2
-            )
-            data[slide_1] = values[: slide_1.stop - slide_1.start]
-            data[slide_2] = values[slide_1.stop - slide_1.start :]
-            self.right_index += n
+        # Only the producer stores the write position, so it can be read without lock here
+        write_position = self.__write_position.value
+        right_index = write_position % self.size
+        slide_1 = np.s_[right_index : min(right_index + n, self.size)]
+        slide_2 = np.s_[: max(right_index + n - self.size, 0)]
+        data = self.data
+        data[slide_1] = values[: slide_1.stop - slide_1.start]
+        data[slide_2] = values[slide_1.stop - slide_1.start :]
 
-        self.__length.value += n
+        # Publish the values only after they are completely written
+        with self.__position_lock:
+            self.__write_position.value = (write_position + n) % self.__position_range
 
     def pop(self, number: int, ensure_even_length=False) -> np.ndarray:
         """
@@ -110,31 +151,35 @@ class RingBuffer(object):
         if ensure_even_length:
             number -= number % 2
 
-        if len(self) == 0 or number == 0:
-            return np.array([], dtype=self.dtype)
+        # A clear arriving after the positions were loaded is carried out on next pop
+        first, end, clear_requests = self.__positions()
+        available = self.__distance(end, first)
 
         if number < 0:
             # take everything
-            number = len(self)
+            number = available
         else:
-            number = min(number, len(self))
+            number = min(number, available)
+
+        left_index = first % self.size
+        data = self.data
+        result = np.empty((number, 2), dtype=self.dtype)
 
-        with self.__data.get_lock():
-            result = np.ones(2 * number, dtype=self.dtype).reshape(number, 2)
-            data = np.frombuffer(self.__data.get_obj(), dtype=self.dtype).reshape(
-                len(self.__data) // 2, 2
-            )
+        if left_index + number > len(data):
+            end_index = len(data) - left_index
+        else:
+            end_index = number
 
-            if self.left_index + number > len(data):
-                end = len(data) - self.left_index
-            else:
-                end = number
+        result[:end_index] = data[left_index : left_index + end_index]
+        if end_index < number:
+            result[end_index:] = data[: number - end_index]
 
-            result[:end] = data[self.left_index : self.left_index + end]
-            if end < number:
-                result[end:] = data[: number - end]
+        # Release the slots to producer only after values are copied out
+        with self.__position_lock:
+            self.__read_position.value = (first + number) % self.__position_range
+            self.__handled_clear_requests.value = clear_requests
 
-        self.left_index += number
-        self.__length.value -= number
+        if number == 0:
+            return np.array([], dtype=self.dtype)
 
         return result
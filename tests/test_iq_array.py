@@ -195,3 +195,23 @@ class TestIQArray(unittest.TestCase):
             np.array_equal(iq32u, np.array([0, 32767, 32767, 65534], dtype=np.uint16)),
             msg=iq32u,
         )
+
+    def test_as_complex64(self):
+        iq64f = IQArray(np.array([-1, 0.5, 0, 1], dtype=np.float32))
+        c64 = iq64f.as_complex64()
+        self.assertEqual(c64.dtype, np.complex64)
+        self.assertTrue(np.array_equal(c64, np.array([-1 + 0.5j, 1j])), msg=c64)
+
+        c64[0] = 42
+        self.assertEqual(iq64f[0][0], -1)
+
+        view = iq64f.as_complex64(copy=False)
+        view[0] = 42
+        self.assertEqual(iq64f[0][0], 42)
+
+        iq16s = IQArray(np.array([-128, 64, 0, 127], dtype=np.int8))
+        c64 = iq16s.as_complex64()
+        self.assertEqual(c64.dtype, np.complex64)
+        self.assertTrue(
+            np.array_equal(c64, iq16s.convert_to(np.float32).view(np.complex64).ravel())
+        )
@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 import numpy as np
@@ -83,6 +84,76 @@ class TestRingBuffer(unittest.TestCase):
         self.assertTrue(ring_buffer.will_fit(4))
         self.assertFalse(ring_buffer.will_fit(5))
 
+    def test_clear(self):
+        ring_buffer = RingBuffer(size=4)
+        ring_buffer.push(IQArray(np.array([1, 2, 3], dtype=np.complex64)))
+        ring_buffer.pop(2)
+        ring_buffer.clear()
+        self.assertTrue(ring_buffer.is_empty)
+        self.assertEqual(ring_buffer.space_left, 4)
+
+        add = IQArray(np.array([4, 5, 6, 7], dtype=np.complex64))
+        ring_buffer.push(add)
+        self.assertEqual(len(ring_buffer), 4)
+        self.assertTrue(np.array_equal(add, ring_buffer.pop(-1)))
+
+    def test_clear_pending(self):
+        ring_buffer = RingBuffer(size=8)
+        add1 = IQArray(np.array([1, 2, 3, 4], dtype=np.complex64))
+        add2 = IQArray(np.array([5, 6], dtype=np.complex64))
+
+        # Clear drops only values pushed until then, even if consumer carries it out later
+        ring_buffer.push(add1)
+        ring_buffer.clear()
+        ring_buffer.push(add2)
+        self.assertEqual(len(ring_buffer), 2)
+        self.assertTrue(np.array_equal(add2, ring_buffer.pop(-1)))
+        self.assertTrue(ring_buffer.is_empty)
+
+        # A clear carried out by pop must not drop values pushed afterwards
+        ring_buffer.push(add1)
+        ring_buffer.clear()
+        self.assertEqual(len(ring_buffer.pop(-1)), 0)
+        ring_buffer.push(add2)
+        self.assertEqual(len(ring_buffer), 2)
+        self.assertTrue(np.array_equal(add2, ring_buffer.pop(-1)))
+
+    def test_clear_while_running(self):
+        ring_buffer = RingBuffer(size=64)
+        values = IQArray(np.arange(16, dtype=np.complex64))
+        finished = threading.Event()
+        errors = []
+
+        def produce():
+            try:
+                while not finished.is_set():
+                    if ring_buffer.will_fit(len(values)):
+                        ring_buffer.push(values)
+            except Exception as e:
+                errors.append(e)
+
+        def consume():
+            try:
+                while not finished.is_set():
+                    ring_buffer.pop(5)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+        for thread in threads:
+            thread.start()
+
+        for _ in range(2000):
+            ring_buffer.clear()
+            self.assertTrue(0 <= len(ring_buffer) <= ring_buffer.size)
+
+        finished.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertTrue(0 <= len(ring_buffer) <= ring_buffer.size)
+
 
 if __name__ == "__main__":
     unittest.main()
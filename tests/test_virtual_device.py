@@ -0,0 +1,199 @@
+import gc
+import unittest
+import weakref
+from unittest.mock import patch
+
+import numpy as np
+
+from urh.dev.BackendHandler import BackendContainer, BackendHandler, Backends
+from urh.dev.VirtualDevice import (
+    VirtualDevice,
+    Mode,
+    NATIVE_DEVICES,
+    _native_device_key,
+    _get_native_device,
+)
+from urh.signalprocessing.IQArray import IQArray
+
+
+class TestVirtualDevice(unittest.TestCase):
+    def setUp(self):
+        self.backend_handler = BackendHandler()
+        self.backend_handler.device_backends["test"] = BackendContainer(
+            "test", {Backends.native}, True, True
+        )
+
+    def test_data_view(self):
+        device = VirtualDevice(self.backend_handler, "test", Mode.receive)
+        device.data = IQArray(np.arange(10, dtype=np.complex64))
+        device.current_index = 6
+
+        view = device.data_view()
+        self.assertTrue(np.array_equal(view, device.data[:6]))
+        self.assertTrue(np.shares_memory(view, device.data.data))
+
+        view = device.data_view(2, 3)
+        self.assertTrue(np.array_equal(view, device.data[2:5]))
+
+        self.assertEqual(len(device.data_view(6)), 0)
+
+    def test_data_view_no_data(self):
+        device = VirtualDevice(self.backend_handler, "test", Mode.receive)
+        self.assertIsNone(device.data)
+        self.assertEqual(len(device.data_view()), 0)
+
+    def test_data_view_send_mode(self):
+        device = VirtualDevice(
+            self.backend_handler,
+            "test",
+            Mode.send,
+            samples_to_send=IQArray(np.arange(10, dtype=np.complex64)),
+        )
+        with self.assertRaises(ValueError):
+            device.data_view()
+
+    def test_backend_none(self):
+        device = VirtualDevice(self.backend_handler, "nonexistent", Mode.receive)
+        self.assertEqual(device.backend, Backends.none)
+
+        for name in ("current_index", "frequency", "samples_to_send"):
+            with self.assertRaises(ValueError, msg=name):
+                getattr(device, name)
+            with self.assertRaises(ValueError, msg=name):
+                setattr(device, name, 42)
+
+        device.ip = "127.0.0.1"  # ignored
+
+    def test_native_send_mode(self):
+        samples = IQArray(np.arange(10, dtype=np.complex64))
+        device = VirtualDevice(
+            self.backend_handler, "test", Mode.send, samples_to_send=samples
+        )
+        dev = device._VirtualDevice__dev
+
+        device.current_index = 4
+        self.assertEqual(dev.current_sent_sample, 4)
+        self.assertEqual(device.current_index, 4)
+        self.assertIs(device.data, dev.samples_to_send)
+        self.assertTrue(np.array_equal(device.data, samples))
+
+        device.num_sending_repeats = 3
+        device.samples_to_send = IQArray(np.arange(5, dtype=np.complex64))
+        self.assertEqual(len(dev.samples_to_send), 5)
+        self.assertEqual(dev.sending_repeats, 3)
+
+    def test_no_reference_cycle(self):
+        gc.disable()
+        try:
+            device = VirtualDevice(self.backend_handler, "test", Mode.send)
+            ref = weakref.ref(device)
+            del device
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+    def test_lazy_send_buffer(self):
+        device = VirtualDevice(
+            self.backend_handler,
+            "test",
+            Mode.send,
+            samples_to_send=IQArray(np.arange(10, dtype=np.complex64)),
+        )
+        dev = device._VirtualDevice__dev
+        self.assertIsNone(dev.send_buffer)
+
+        with patch.object(dev, "iq_to_bytes", return_value=b"buffer") as iq_to_bytes:
+            device.samples_to_send = IQArray(np.arange(20, dtype=np.complex64))
+            self.assertIsNone(dev.send_buffer)
+            self.assertEqual(len(dev.samples_to_send), 20)
+
+            dev.init_send_buffer()
+            dev.init_send_buffer()
+            self.assertEqual(dev.send_buffer, b"buffer")
+            self.assertEqual(iq_to_bytes.call_count, 1)
+
+            # Updating samples must not build the buffer, but drop the outdated one
+            dev.current_sending_repeat = 3
+            device.samples_to_send = IQArray(np.arange(5, dtype=np.complex64))
+            self.assertIsNone(dev.send_buffer)
+            self.assertEqual(iq_to_bytes.call_count, 1)
+
+        # Sending repeat is reset regardless of whether send buffer was built yet
+        dev.init_send_parameters(resume=True)
+        self.assertEqual(dev.current_sending_repeat, 3)
+        dev.init_send_parameters(resume=False)
+        self.assertEqual(dev.current_sending_repeat, 0)
+
+    def test_clear_messages(self):
+        device = VirtualDevice(self.backend_handler, "test", Mode.receive)
+        errors, ready = [], []
+        device.fatal_error_occurred.connect(errors.append)
+        device.ready_for_action.connect(lambda: ready.append(True))
+        messages = device._VirtualDevice__dev.device_messages
+
+        messages.extend(["opening device", "test failed to start", "code -1"])
+        device.clear_messages()
+        self.assertEqual(messages, [])
+        self.assertEqual(errors, ["failed to start\ncode -1\n"])
+        self.assertEqual(ready, [])
+
+        messages.extend(["test successfully started"])
+        device.clear_messages()
+        self.assertEqual(messages, [])
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(ready, [True])
+
+    def test_native_devices(self):
+        # Class and constructor parameters per device name as created by the former if/elif chain
+        full = (
+            "center_freq",
+            "sample_rate",
+            "bandwidth",
+            "gain",
+            "if_gain",
+            "baseband_gain",
+        )
+        basic = ("center_freq", "sample_rate", "bandwidth", "gain")
+        expected = {
+            "airspy r2": ("AirSpy", full),
+            "airspy mini": ("AirSpy", full),
+            "bladerf": ("BladeRF", basic),
+            "hackrf": ("HackRF", full),
+            "rad1o": ("Rad1o", full),
+            "limesdr": ("LimeSDR", basic),
+            "plutosdr": ("PlutoSDR", basic),
+            "rtl-sdr": ("RTLSDR", ("freq", "gain", "srate", "device_number")),
+            "rtl-tcp": (
+                "RTLSDRTCP",
+                ("freq", "gain", "srate", "bandwidth", "device_number"),
+            ),
+            "sdrplay": ("SDRPlay", basic + ("if_gain",)),
+            "soundcard": ("SoundCard", ("sample_rate",)),
+            "usrp": ("USRP", basic),
+        }
+
+        names = set(map(str.lower, BackendHandler.DEVICE_NAMES))
+        self.assertEqual(names - set(expected), {"funcube"})
+
+        for name, (class_name, parameter_names) in expected.items():
+            import_device_class, params = NATIVE_DEVICES[_native_device_key(name)]
+            self.assertEqual(params, parameter_names, msg=name)
+            # Check the statically imported class without importing it, as native libs may be missing
+            self.assertEqual(
+                import_device_class.__code__.co_names,
+                ("urh.dev.native." + class_name, class_name),
+                msg=name,
+            )
+
+        with self.assertRaises(NotImplementedError):
+            _get_native_device("funcube")
+
+        self.assertIsNone(_get_native_device("test"))
+
+        device_class, params = _get_native_device("rtl-tcp")
+        self.assertEqual(device_class.__name__, "RTLSDRTCP")
+        self.assertIs(_get_native_device("rtl-tcp")[0], device_class)
+
+
+if __name__ == "__main__":
+    unittest.main()